@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Optional
 from edgar import Company, set_identity, find_company, search
 from ..utils.cache import TickerCache
 from ..utils.exceptions import CompanyNotFoundError
@@ -16,6 +16,8 @@ class EdgarClient:
         # Also set the default user agent
         edgar.set_identity(self._user_agent)
         self._ticker_cache = TickerCache(self._user_agent)
+        # Resolved ticker -> zero-padded CIK; the mapping is stable for a session
+        self._cik_by_ticker: Dict[str, str] = {}
 
     def get_company(self, identifier: str) -> Company:
         """Get a Company object by ticker or CIK."""
@@ -36,6 +38,18 @@ class EdgarClient:
 
     def get_cik_by_ticker(self, ticker: str) -> Optional[str]:
         """Get CIK by ticker symbol."""
+        ticker_upper = ticker.upper()
+        cik = self._cik_by_ticker.get(ticker_upper)
+        if cik:
+            return cik
+
+        cik = self._lookup_cik(ticker)
+        if cik:
+            self._cik_by_ticker[ticker_upper] = cik
+        return cik
+
+    def _lookup_cik(self, ticker: str) -> Optional[str]:
+        """Resolve a ticker to a CIK without consulting the per-session cache."""
         # Try the cache first
         cik = self._ticker_cache.get_cik(ticker)
         if cik:
@@ -6,6 +6,7 @@ import re
 import requests
 from typing import List, Dict, Optional, Any, Union
 from bs4 import BeautifulSoup
+from .utils.http import SHARED_SESSION
 
 
 class FilingSection:
@@ -83,7 +84,7 @@ class SECDocumentParser:
         }
 
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = SHARED_SESSION.get(url, headers=headers, timeout=30)
             response.raise_for_status()
             return response.text
         except requests.RequestException as e:
@@ -1,9 +1,14 @@
-import argparse
 import logging
+import sys
+from functools import lru_cache
 from mcp.server.fastmcp import FastMCP
+from sec_edgar_mcp.core import EdgarClient
 from sec_edgar_mcp.tools import CompanyTools, FilingsTools, FinancialTools, InsiderTools
+from sec_edgar_mcp.utils.cache import FilingCache
 
 # Suppress INFO logs from edgar library
+# The level check runs before a record is created, so edgartools' INFO/DEBUG
+# calls return without formatting anything; warnings still reach our handlers.
 logging.getLogger("edgar").setLevel(logging.WARNING)
 
 
@@ -38,371 +43,375 @@ CRITICAL: NEVER round numbers like "$37.0B" - always show exact values like "$37
 YOU ARE A FILING DATA EXTRACTION SERVICE, NOT A FINANCIAL ANALYST OR ADVISOR.
 """
 
-# Initialize tool classes
-company_tools = CompanyTools()
-filings_tools = FilingsTools()
-financial_tools = FinancialTools()
-insider_tools = InsiderTools()
 
-
-# Company Tools
-def get_cik_by_ticker(ticker: str):
-    """
-    Get the CIK (Central Index Key) for a company based on its ticker symbol.
-
-    Args:
-        ticker: The ticker symbol of the company (e.g., "NVDA", "AAPL")
-
-    Returns:
-        Dictionary containing the CIK number or error message
-    """
-    return company_tools.get_cik_by_ticker(ticker)
+# Tool groups are created by register_tools; each factory returns the same
+# instance on every call.
+@lru_cache(maxsize=1)
+def _edgar_client():
+    """Shared client so all tool groups use one ticker table and CIK cache."""
+    return EdgarClient()
 
 
-def get_company_info(identifier: str):
-    """
-    Get detailed information about a company from SEC records.
+@lru_cache(maxsize=1)
+def _company_tools():
+    return CompanyTools(_edgar_client())
 
-    CRITICAL INSTRUCTIONS FOR LLM RESPONSES:
-    - ONLY use data returned from SEC records. NEVER add external information.
-    - ALWAYS include any filing reference information if provided.
-    - Be completely deterministic - same query should always give same response.
-    - If information is not in SEC records, say "Not available in SEC records".
 
-    Args:
-        identifier: Company ticker symbol or CIK number
+@lru_cache(maxsize=1)
+def _filings_tools():
+    return FilingsTools(_edgar_client())
 
-    Returns:
-        Dictionary containing company information from SEC records including name, CIK, SIC, exchange, etc.
-    """
-    return company_tools.get_company_info(identifier)
 
+@lru_cache(maxsize=1)
+def _financial_tools():
+    return FinancialTools(_edgar_client())
 
-def search_companies(query: str, limit: int = 10):
-    """
-    Search for companies by name.
 
-    Args:
-        query: Search query for company name
-        limit: Maximum number of results to return (default: 10)
+@lru_cache(maxsize=1)
+def _insider_tools():
+    return InsiderTools(_edgar_client())
 
-    Returns:
-        Dictionary containing list of matching companies
-    """
-    return company_tools.search_companies(query, limit)
 
+# Tool descriptions shown to MCP clients
 
-def get_company_facts(identifier: str):
-    """
-    Get company facts and key financial metrics.
+# Company Tools
+GET_CIK_BY_TICKER_DESCRIPTION = """Get the CIK (Central Index Key) for a company based on its ticker symbol.
 
-    Args:
-        identifier: Company ticker symbol or CIK number
+Args:
+    ticker: The ticker symbol of the company (e.g., "NVDA", "AAPL")
 
-    Returns:
-        Dictionary containing available financial metrics
-    """
-    return company_tools.get_company_facts(identifier)
+Returns:
+    Dictionary containing the CIK number or error message"""
 
+GET_COMPANY_INFO_DESCRIPTION = """Get detailed information about a company from SEC records.
 
-# Filing Tools
-def get_recent_filings(identifier: str = None, form_type: str = None, days: int = 30, limit: int = 50):
-    """
-    Get recent SEC filings for a company or across all companies.
+CRITICAL INSTRUCTIONS FOR LLM RESPONSES:
+- ONLY use data returned from SEC records. NEVER add external information.
+- ALWAYS include any filing reference information if provided.
+- Be completely deterministic - same query should always give same response.
+- If information is not in SEC records, say "Not available in SEC records".
 
-    Args:
-        identifier: Company ticker/CIK (optional, if not provided returns all recent filings)
-        form_type: Specific form type to filter (e.g., "10-K", "10-Q", "8-K", "CORRESP", "UPLOAD")
-        days: Number of days to look back (default: 30)
-        limit: Maximum number of filings to return (default: 50)
+Args:
+    identifier: Company ticker symbol or CIK number
 
-    Returns:
-        Dictionary containing list of recent filings
-    """
-    return filings_tools.get_recent_filings(identifier, form_type, days, limit)
+Returns:
+    Dictionary containing company information from SEC records including name, CIK, SIC, exchange, etc."""
 
+SEARCH_COMPANIES_DESCRIPTION = """Search for companies by name.
 
-def get_filing_content(identifier: str, accession_number: str):
-    """
-    Get the content of a specific SEC filing.
+Args:
+    query: Search query for company name
+    limit: Maximum number of results to return (default: 10)
 
-    Args:
-        identifier: Company ticker symbol or CIK number
-        accession_number: The accession number of the filing
+Returns:
+    Dictionary containing list of matching companies"""
 
-    Returns:
-        Dictionary containing filing content and metadata
-    """
-    return filings_tools.get_filing_content(identifier, accession_number)
+GET_COMPANY_FACTS_DESCRIPTION = """Get company facts and key financial metrics.
 
+Args:
+    identifier: Company ticker symbol or CIK number
 
-def analyze_8k(identifier: str, accession_number: str):
-    """
-    Analyze an 8-K filing for specific events and items.
+Returns:
+    Dictionary containing available financial metrics"""
 
-    Args:
-        identifier: Company ticker symbol or CIK number
-        accession_number: The accession number of the 8-K filing
+# Filing Tools
+GET_RECENT_FILINGS_DESCRIPTION = """Get recent SEC filings for a company or across all companies.
 
-    Returns:
-        Dictionary containing analysis of 8-K items and events
-    """
-    return filings_tools.analyze_8k(identifier, accession_number)
+Args:
+    identifier: Company ticker/CIK (optional, if not provided returns all recent filings)
+    form_type: Specific form type to filter (e.g., "10-K", "10-Q", "8-K", "CORRESP", "UPLOAD")
+    days: Number of days to look back (default: 30)
+    limit: Maximum number of filings to return (default: 50)
 
+Returns:
+    Dictionary containing list of recent filings"""
 
-def get_filing_sections(identifier: str, accession_number: str, form_type: str):
-    """
-    Get specific sections from a filing (e.g., business description, risk factors, MD&A).
+GET_FILING_CONTENT_DESCRIPTION = """Get the content of a specific SEC filing.
 
-    Args:
-        identifier: Company ticker symbol or CIK number
-        accession_number: The accession number of the filing
-        form_type: The type of form (e.g., "10-K", "10-Q")
+Args:
+    identifier: Company ticker symbol or CIK number
+    accession_number: The accession number of the filing
 
-    Returns:
-        Dictionary containing available sections from the filing
-    """
-    return filings_tools.get_filing_sections(identifier, accession_number, form_type)
+Returns:
+    Dictionary containing filing content and metadata"""
 
+ANALYZE_8K_DESCRIPTION = """Analyze an 8-K filing for specific events and items.
 
-# Financial Tools
-def get_financials(identifier: str, statement_type: str = "all"):
-    """
-    Get financial statements for a company. USE THIS TOOL when users ask for:
-    - Cash flow, cash flow statement, operating cash flow, investing cash flow, financing cash flow
-    - Income statement, revenue, net income, earnings, profit/loss, operating income
-    - Balance sheet, assets, liabilities, equity, cash and cash equivalents
-    - Any financial statement data or financial metrics
-
-    CRITICAL INSTRUCTIONS FOR LLM RESPONSES:
-    - ONLY use data from the returned SEC filing. NEVER add external information.
-    - ALWAYS include the filing reference information with clickable SEC URL in your response.
-    - NEVER estimate, calculate, or interpret data beyond what is explicitly in the filing.
-    - PRESERVE EXACT NUMERIC PRECISION - NO ROUNDING! Show exact values like $37,044,000,000 not $37.0B.
-    - ALWAYS state the exact filing date and form type when presenting data.
-    - Be completely deterministic - same query should always give same response.
-    - If data is not in the filing, say "Not available in this filing" - DO NOT guess.
+Args:
+    identifier: Company ticker symbol or CIK number
+    accession_number: The accession number of the 8-K filing
 
-    Args:
-        identifier: Company ticker symbol or CIK number
-        statement_type: Type of statement ("income", "balance", "cash", or "all")
-
-    Returns:
-        Dictionary containing financial statement data extracted directly from SEC EDGAR filings,
-        including filing_reference with source URLs and disclaimer.
-    """
-    return financial_tools.get_financials(identifier, statement_type)
+Returns:
+    Dictionary containing analysis of 8-K items and events"""
 
+GET_FILING_SECTIONS_DESCRIPTION = """\
+Get specific sections from a filing (e.g., business description, risk factors, MD&A).
 
-def get_segment_data(identifier: str, segment_type: str = "geographic"):
-    """
-    Get revenue breakdown by segments (geographic, product, etc.).
+Args:
+    identifier: Company ticker symbol or CIK number
+    accession_number: The accession number of the filing
+    form_type: The type of form (e.g., "10-K", "10-Q")
 
-    Args:
-        identifier: Company ticker symbol or CIK number
-        segment_type: Type of segment analysis (default: "geographic")
+Returns:
+    Dictionary containing available sections from the filing"""
 
-    Returns:
-        Dictionary containing segment revenue data
-    """
-    return financial_tools.get_segment_data(identifier, segment_type)
+# Financial Tools
+GET_FINANCIALS_DESCRIPTION = """Get financial statements for a company. USE THIS TOOL when users ask for:
+- Cash flow, cash flow statement, operating cash flow, investing cash flow, financing cash flow
+- Income statement, revenue, net income, earnings, profit/loss, operating income
+- Balance sheet, assets, liabilities, equity, cash and cash equivalents
+- Any financial statement data or financial metrics
 
+CRITICAL INSTRUCTIONS FOR LLM RESPONSES:
+- ONLY use data from the returned SEC filing. NEVER add external information.
+- ALWAYS include the filing reference information with clickable SEC URL in your response.
+- NEVER estimate, calculate, or interpret data beyond what is explicitly in the filing.
+- PRESERVE EXACT NUMERIC PRECISION - NO ROUNDING! Show exact values like $37,044,000,000 not $37.0B.
+- ALWAYS state the exact filing date and form type when presenting data.
+- Be completely deterministic - same query should always give same response.
+- If data is not in the filing, say "Not available in this filing" - DO NOT guess.
 
-def get_key_metrics(identifier: str, metrics: list = None):
-    """
-    Get key financial metrics for a company.
+Args:
+    identifier: Company ticker symbol or CIK number
+    statement_type: Type of statement ("income", "balance", "cash", or "all")
 
-    Args:
-        identifier: Company ticker symbol or CIK number
-        metrics: List of specific metrics to retrieve (optional)
+Returns:
+    Dictionary containing financial statement data extracted directly from SEC EDGAR filings,
+    including filing_reference with source URLs and disclaimer."""
 
-    Returns:
-        Dictionary containing requested financial metrics
-    """
-    return financial_tools.get_key_metrics(identifier, metrics)
+GET_SEGMENT_DATA_DESCRIPTION = """Get revenue breakdown by segments (geographic, product, etc.).
 
+Args:
+    identifier: Company ticker symbol or CIK number
+    segment_type: Type of segment analysis (default: "geographic")
 
-def compare_periods(identifier: str, metric: str, start_year: int, end_year: int):
-    """
-    Compare a financial metric across different time periods.
+Returns:
+    Dictionary containing segment revenue data"""
 
-    Args:
-        identifier: Company ticker symbol or CIK number
-        metric: The financial metric to compare (e.g., "Revenues", "NetIncomeLoss")
-        start_year: Starting year for comparison
-        end_year: Ending year for comparison
+GET_KEY_METRICS_DESCRIPTION = """Get key financial metrics for a company.
 
-    Returns:
-        Dictionary containing period comparison data and growth analysis
-    """
-    return financial_tools.compare_periods(identifier, metric, start_year, end_year)
+Args:
+    identifier: Company ticker symbol or CIK number
+    metrics: List of specific metrics to retrieve (optional)
 
+Returns:
+    Dictionary containing requested financial metrics"""
 
-def discover_company_metrics(identifier: str, search_term: str = None):
-    """
-    Discover available financial metrics for a company.
+COMPARE_PERIODS_DESCRIPTION = """Compare a financial metric across different time periods.
 
-    Args:
-        identifier: Company ticker symbol or CIK number
-        search_term: Optional search term to filter metrics
+Args:
+    identifier: Company ticker symbol or CIK number
+    metric: The financial metric to compare (e.g., "Revenues", "NetIncomeLoss")
+    start_year: Starting year for comparison
+    end_year: Ending year for comparison
 
-    Returns:
-        Dictionary containing list of available metrics
-    """
-    return financial_tools.discover_company_metrics(identifier, search_term)
+Returns:
+    Dictionary containing period comparison data and growth analysis"""
 
+DISCOVER_COMPANY_METRICS_DESCRIPTION = """Discover available financial metrics for a company.
 
-def get_xbrl_concepts(identifier: str, accession_number: str = None, concepts: list = None, form_type: str = "10-K"):
-    """
-    ADVANCED TOOL: Extract specific XBRL concepts from a filing.
+Args:
+    identifier: Company ticker symbol or CIK number
+    search_term: Optional search term to filter metrics
 
-    DO NOT USE for general financial data requests. Use get_financials() instead for:
-    - Cash flow statements, income statements, balance sheets
-    - Revenue, net income, assets, liabilities, cash data
+Returns:
+    Dictionary containing list of available metrics"""
 
-    CRITICAL INSTRUCTIONS FOR LLM RESPONSES:
-    - ONLY report values found in the specific SEC filing. NEVER add context from other sources.
-    - ALWAYS include the filing reference information with clickable SEC URL (date, accession number, SEC URL).
-    - NEVER estimate or calculate values not explicitly present in the filing.
-    - PRESERVE EXACT NUMERIC PRECISION - NO ROUNDING! Show exact values like $37,044,000,000 not $37.0B.
-    - ALWAYS specify the exact period/context for each value from the filing.
-    - Be completely deterministic - identical queries must give identical responses.
-    - If a concept is not found in the filing, state "Not found in this filing" - DO NOT guess.
+GET_XBRL_CONCEPTS_DESCRIPTION = """ADVANCED TOOL: Extract specific XBRL concepts from a filing.
 
-    Args:
-        identifier: Company ticker symbol or CIK number
-        accession_number: Optional specific filing accession number
-        concepts: Optional list of specific concepts to extract (e.g., ["Revenues", "Assets"])
-        form_type: Form type if no accession number provided (default: "10-K")
+DO NOT USE for general financial data requests. Use get_financials() instead for:
+- Cash flow statements, income statements, balance sheets
+- Revenue, net income, assets, liabilities, cash data
 
-    Returns:
-        Dictionary containing extracted XBRL concepts with filing_reference and source URLs.
-    """
-    return financial_tools.get_xbrl_concepts(identifier, accession_number, concepts, form_type)
+CRITICAL INSTRUCTIONS FOR LLM RESPONSES:
+- ONLY report values found in the specific SEC filing. NEVER add context from other sources.
+- ALWAYS include the filing reference information with clickable SEC URL (date, accession number, SEC URL).
+- NEVER estimate or calculate values not explicitly present in the filing.
+- PRESERVE EXACT NUMERIC PRECISION - NO ROUNDING! Show exact values like $37,044,000,000 not $37.0B.
+- ALWAYS specify the exact period/context for each value from the filing.
+- Be completely deterministic - identical queries must give identical responses.
+- If a concept is not found in the filing, state "Not found in this filing" - DO NOT guess.
 
+Args:
+    identifier: Company ticker symbol or CIK number
+    accession_number: Optional specific filing accession number
+    concepts: Optional list of specific concepts to extract (e.g., ["Revenues", "Assets"])
+    form_type: Form type if no accession number provided (default: "10-K")
 
-def discover_xbrl_concepts(
-    identifier: str, accession_number: str = None, form_type: str = "10-K", namespace_filter: str = None
-):
-    """
-    Discover all available XBRL concepts in a filing, including company-specific ones.
+Returns:
+    Dictionary containing extracted XBRL concepts with filing_reference and source URLs."""
 
-    Args:
-        identifier: Company ticker symbol or CIK number
-        accession_number: Optional specific filing accession number
-        form_type: Form type if no accession number provided (default: "10-K")
-        namespace_filter: Optional filter to show only concepts from specific namespace
+DISCOVER_XBRL_CONCEPTS_DESCRIPTION = """\
+Discover all available XBRL concepts in a filing, including company-specific ones.
 
-    Returns:
-        Dictionary containing all discovered XBRL concepts, namespaces, and company-specific tags
-    """
-    return financial_tools.discover_xbrl_concepts(identifier, accession_number, form_type, namespace_filter)
+Args:
+    identifier: Company ticker symbol or CIK number
+    accession_number: Optional specific filing accession number
+    form_type: Form type if no accession number provided (default: "10-K")
+    namespace_filter: Optional filter to show only concepts from specific namespace
 
+Returns:
+    Dictionary containing all discovered XBRL concepts, namespaces, and company-specific tags"""
 
 # Insider Trading Tools
-def get_insider_transactions(identifier: str, form_types: list = None, days: int = 90, limit: int = 50):
-    """
-    Get insider trading transactions for a company from SEC filings.
+GET_INSIDER_TRANSACTIONS_DESCRIPTION = """Get insider trading transactions for a company from SEC filings.
 
-    CRITICAL INSTRUCTIONS FOR LLM RESPONSES:
-    - ONLY use data from the returned SEC insider filings. NEVER add external information.
-    - ALWAYS include the filing reference information with clickable SEC URLs in your response.
-    - NEVER estimate or calculate values not explicitly present in the filings.
-    - PRESERVE EXACT DATES AND VALUES - NO ROUNDING! Show exact values from filings.
-    - ALWAYS specify the exact filing date and accession number for each transaction.
-    - Be completely deterministic - same query should always give same response.
-    - If data is not in the filing, say "Not available in this filing" - DO NOT guess.
+CRITICAL INSTRUCTIONS FOR LLM RESPONSES:
+- ONLY use data from the returned SEC insider filings. NEVER add external information.
+- ALWAYS include the filing reference information with clickable SEC URLs in your response.
+- NEVER estimate or calculate values not explicitly present in the filings.
+- PRESERVE EXACT DATES AND VALUES - NO ROUNDING! Show exact values from filings.
+- ALWAYS specify the exact filing date and accession number for each transaction.
+- Be completely deterministic - same query should always give same response.
+- If data is not in the filing, say "Not available in this filing" - DO NOT guess.
 
-    Args:
-        identifier: Company ticker symbol or CIK number
-        form_types: List of form types to include (default: ["3", "4", "5"])
-        days: Number of days to look back (default: 90)
-        limit: Maximum number of transactions to return (default: 50)
+Args:
+    identifier: Company ticker symbol or CIK number
+    form_types: List of form types to include (default: ["3", "4", "5"])
+    days: Number of days to look back (default: 90)
+    limit: Maximum number of transactions to return (default: 50)
 
-    Returns:
-        Dictionary containing insider transactions with direct SEC URLs for verification
-    """
-    return insider_tools.get_insider_transactions(identifier, form_types, days, limit)
+Returns:
+    Dictionary containing insider transactions with direct SEC URLs for verification"""
 
+GET_INSIDER_SUMMARY_DESCRIPTION = """Get a summary of insider trading activity for a company from SEC filings.
 
-def get_insider_summary(identifier: str, days: int = 180):
-    """
-    Get a summary of insider trading activity for a company from SEC filings.
+CRITICAL INSTRUCTIONS FOR LLM RESPONSES:
+- ONLY use data from the returned SEC insider filings. NEVER add external information.
+- ALWAYS include the filing reference information with SEC URLs in your response.
+- PRESERVE EXACT COUNTS AND DATES - NO ROUNDING OR ESTIMATES!
+- Be completely deterministic - same query should always give same response.
+- If data is not in the filing, say "Not available in filings" - DO NOT guess.
 
-    CRITICAL INSTRUCTIONS FOR LLM RESPONSES:
-    - ONLY use data from the returned SEC insider filings. NEVER add external information.
-    - ALWAYS include the filing reference information with SEC URLs in your response.
-    - PRESERVE EXACT COUNTS AND DATES - NO ROUNDING OR ESTIMATES!
-    - Be completely deterministic - same query should always give same response.
-    - If data is not in the filing, say "Not available in filings" - DO NOT guess.
+Args:
+    identifier: Company ticker symbol or CIK number
+    days: Number of days to analyze (default: 180)
 
-    Args:
-        identifier: Company ticker symbol or CIK number
-        days: Number of days to analyze (default: 180)
+Returns:
+    Dictionary containing insider trading summary from SEC filings"""
 
-    Returns:
-        Dictionary containing insider trading summary from SEC filings
-    """
-    return insider_tools.get_insider_summary(identifier, days)
+GET_FORM4_DETAILS_DESCRIPTION = """Get detailed information from a specific Form 4 filing.
 
+Args:
+    identifier: Company ticker symbol or CIK number
+    accession_number: The accession number of the Form 4
 
-def get_form4_details(identifier: str, accession_number: str):
-    """
-    Get detailed information from a specific Form 4 filing.
+Returns:
+    Dictionary containing detailed Form 4 information"""
 
-    Args:
-        identifier: Company ticker symbol or CIK number
-        accession_number: The accession number of the Form 4
+ANALYZE_FORM4_TRANSACTIONS_DESCRIPTION = """\
+Analyze Form 4 filings and extract detailed transaction data including insider names,
+transaction amounts, share counts, prices, and ownership details.
 
-    Returns:
-        Dictionary containing detailed Form 4 information
-    """
-    return insider_tools.get_form4_details(identifier, accession_number)
+USE THIS TOOL when users ask for detailed insider transaction analysis, transaction tables,
+or specific transaction amounts from Form 4 filings.
 
+CRITICAL INSTRUCTIONS FOR LLM RESPONSES:
+- ONLY use data from the returned SEC Form 4 filings. NEVER add external information.
+- ALWAYS include the filing reference information with clickable SEC URLs.
+- PRESERVE EXACT NUMERIC VALUES - NO ROUNDING! Show exact share counts and prices.
+- ALWAYS specify the exact filing date and accession number for each transaction.
+- Present data in table format when requested by users.
+- Be completely deterministic - same query should always give same response.
+- If data is not in the filing, say "Not available in this filing" - DO NOT guess.
 
-def analyze_form4_transactions(identifier: str, days: int = 90, limit: int = 50):
-    """
-    Analyze Form 4 filings and extract detailed transaction data including insider names,
-    transaction amounts, share counts, prices, and ownership details.
+Args:
+    identifier: Company ticker symbol or CIK number
+    days: Number of days to look back (default: 90)
+    limit: Maximum number of filings to analyze (default: 50)
 
-    USE THIS TOOL when users ask for detailed insider transaction analysis, transaction tables,
-    or specific transaction amounts from Form 4 filings.
+Returns:
+    Dictionary containing detailed Form 4 transaction analysis with exact values from SEC filings"""
 
-    CRITICAL INSTRUCTIONS FOR LLM RESPONSES:
-    - ONLY use data from the returned SEC Form 4 filings. NEVER add external information.
-    - ALWAYS include the filing reference information with clickable SEC URLs.
-    - PRESERVE EXACT NUMERIC VALUES - NO ROUNDING! Show exact share counts and prices.
-    - ALWAYS specify the exact filing date and accession number for each transaction.
-    - Present data in table format when requested by users.
-    - Be completely deterministic - same query should always give same response.
-    - If data is not in the filing, say "Not available in this filing" - DO NOT guess.
+ANALYZE_INSIDER_SENTIMENT_DESCRIPTION = """Analyze insider trading sentiment and trends over time.
 
-    Args:
-        identifier: Company ticker symbol or CIK number
-        days: Number of days to look back (default: 90)
-        limit: Maximum number of filings to analyze (default: 50)
+Args:
+    identifier: Company ticker symbol or CIK number
+    months: Number of months to analyze (default: 6)
 
-    Returns:
-        Dictionary containing detailed Form 4 transaction analysis with exact values from SEC filings
-    """
-    return insider_tools.analyze_form4_transactions(identifier, days, limit)
-
-
-def analyze_insider_sentiment(identifier: str, months: int = 6):
-    """
-    Analyze insider trading sentiment and trends over time.
+Returns:
+    Dictionary containing sentiment analysis and trends"""
 
-    Args:
-        identifier: Company ticker symbol or CIK number
-        months: Number of months to analyze (default: 6)
-
-    Returns:
-        Dictionary containing sentiment analysis and trends
-    """
-    return insider_tools.analyze_insider_sentiment(identifier, months)
+# Utility Tools
+# Built once at import; get_recommended_tools only does a dict lookup.
+# (form type, tools, description, tips)
+_RECOMMENDATIONS = (
+    (
+        "10-K",
+        ("get_financials", "get_filing_sections", "get_segment_data", "get_key_metrics"),
+        "Annual report with comprehensive business and financial information",
+        (
+            "Use get_financials to extract financial statements",
+            "Use get_filing_sections to read business description and risk factors",
+            "Use get_segment_data for geographic/product revenue breakdown",
+        ),
+    ),
+    (
+        "10-Q",
+        ("get_financials", "get_filing_sections", "compare_periods"),
+        "Quarterly report with unaudited financial statements",
+        (
+            "Use get_financials for quarterly financial data",
+            "Use compare_periods to analyze quarter-over-quarter trends",
+        ),
+    ),
+    (
+        "8-K",
+        ("analyze_8k", "get_filing_content"),
+        "Current report for material events",
+        (
+            "Use analyze_8k to identify specific events reported",
+            "Check for press releases and material agreements",
+        ),
+    ),
+    (
+        "4",
+        (
+            "get_insider_transactions",
+            "analyze_form4_transactions",
+            "get_form4_details",
+            "analyze_insider_sentiment",
+        ),
+        "Statement of changes in beneficial ownership",
+        (
+            "Use get_insider_transactions for recent trading activity overview",
+            "Use analyze_form4_transactions for detailed transaction analysis and tables",
+            "Use analyze_insider_sentiment to understand trading patterns",
+        ),
+    ),
+    (
+        "DEF 14A",
+        ("get_filing_content", "get_filing_sections"),
+        "Proxy statement with executive compensation and governance",
+        ("Look for executive compensation tables", "Review shareholder proposals and board information"),
+    ),
+    (
+        "CORRESP",
+        ("get_filing_content",),
+        "back-and-forth correspondence between the SEC staff and companies regarding a filing.",
+        ("look at the context of the filing to understand the correspondence",),
+    ),
+    (
+        "UPLOAD",
+        ("get_filing_content",),
+        "Uploaded documents and correspondence files submitted to the SEC.",
+        ("look at the context of the filing to understand the uploaded documents",),
+    ),
+)
+
+# Keyed by both the canonical and the lower-case spelling, so the usual inputs
+# ("10-K", "10-k") hit without normalising the argument first.
+_RECOMMENDATIONS_RESPONSES = {
+    spelling: {
+        "success": True,
+        "form_type": form_type,
+        "recommendations": {"tools": tools, "description": description, "tips": tips},
+    }
+    for form_type, tools, description, tips in _RECOMMENDATIONS
+    for spelling in (form_type, form_type.lower())
+}
 
 
-# Utility Tools
 def get_recommended_tools(form_type: str):
     """
     Get recommended tools for analyzing specific form types.
@@ -413,66 +422,14 @@ def get_recommended_tools(form_type: str):
     Returns:
         Dictionary containing recommended tools and usage tips
     """
-    recommendations = {
-        "10-K": {
-            "tools": ["get_financials", "get_filing_sections", "get_segment_data", "get_key_metrics"],
-            "description": "Annual report with comprehensive business and financial information",
-            "tips": [
-                "Use get_financials to extract financial statements",
-                "Use get_filing_sections to read business description and risk factors",
-                "Use get_segment_data for geographic/product revenue breakdown",
-            ],
-        },
-        "10-Q": {
-            "tools": ["get_financials", "get_filing_sections", "compare_periods"],
-            "description": "Quarterly report with unaudited financial statements",
-            "tips": [
-                "Use get_financials for quarterly financial data",
-                "Use compare_periods to analyze quarter-over-quarter trends",
-            ],
-        },
-        "8-K": {
-            "tools": ["analyze_8k", "get_filing_content"],
-            "description": "Current report for material events",
-            "tips": [
-                "Use analyze_8k to identify specific events reported",
-                "Check for press releases and material agreements",
-            ],
-        },
-        "4": {
-            "tools": [
-                "get_insider_transactions",
-                "analyze_form4_transactions",
-                "get_form4_details",
-                "analyze_insider_sentiment",
-            ],
-            "description": "Statement of changes in beneficial ownership",
-            "tips": [
-                "Use get_insider_transactions for recent trading activity overview",
-                "Use analyze_form4_transactions for detailed transaction analysis and tables",
-                "Use analyze_insider_sentiment to understand trading patterns",
-            ],
-        },
-        "DEF 14A": {
-            "tools": ["get_filing_content", "get_filing_sections"],
-            "description": "Proxy statement with executive compensation and governance",
-            "tips": ["Look for executive compensation tables", "Review shareholder proposals and board information"],
-        },
-        "CORRESP": {
-            "tools": ["get_filing_content"],
-            "description": "back-and-forth correspondence between the SEC staff and companies regarding a filing.",
-            "tips": ["look at the context of the filing to understand the correspondence"],
-        },
-        "UPLOAD": {
-            "tools": ["get_filing_content"],
-            "description": "Uploaded documents and correspondence files submitted to the SEC.",
-            "tips": ["look at the context of the filing to understand the uploaded documents"],
-        },
-    }
+    response = _RECOMMENDATIONS_RESPONSES.get(form_type)
+    if response is not None:
+        return response
 
     form_type_upper = form_type.upper()
-    if form_type_upper in recommendations:
-        return {"success": True, "form_type": form_type_upper, "recommendations": recommendations[form_type_upper]}
+    response = _RECOMMENDATIONS_RESPONSES.get(form_type_upper)
+    if response is not None:
+        return response
     else:
         return {
             "success": True,
@@ -482,42 +439,115 @@ def get_recommended_tools(form_type: str):
         }
 
 
-def register_tools(mcp):
-    """Register all tools with the MCP server."""
-    # Company Tools
-    mcp.add_tool(get_cik_by_ticker)
-    mcp.add_tool(get_company_info)
-    mcp.add_tool(search_companies)
-    mcp.add_tool(get_company_facts)
+class SecEdgarMCP(FastMCP):
+    """FastMCP server that builds the tool listing once instead of on every list_tools request."""
 
-    # Filing Tools
-    mcp.add_tool(get_recent_filings)
-    mcp.add_tool(get_filing_content)
-    mcp.add_tool(analyze_8k)
-    mcp.add_tool(get_filing_sections)
+    def __init__(self, *args, **kwargs):
+        self._tool_listing = None
+        super().__init__(*args, **kwargs)
 
-    # Financial Tools
-    mcp.add_tool(get_financials)
-    mcp.add_tool(get_segment_data)
-    mcp.add_tool(get_key_metrics)
-    mcp.add_tool(compare_periods)
-    mcp.add_tool(discover_company_metrics)
-    mcp.add_tool(get_xbrl_concepts)
-    mcp.add_tool(discover_xbrl_concepts)
+    async def list_tools(self):
+        # Tools are registered once at startup, so the listing only changes
+        # when a tool is added or removed.
+        if self._tool_listing is None:
+            self._tool_listing = await super().list_tools()
+        return self._tool_listing
+
+    def add_tool(self, *args, **kwargs):
+        super().add_tool(*args, **kwargs)
+        self._tool_listing = None
+
+    def remove_tool(self, *args, **kwargs):
+        super().remove_tool(*args, **kwargs)
+        self._tool_listing = None
 
+
+# (tool name, tool group factory, description); each tool is the same-named method on its group
+TOOL_MAP = (
+    # Company Tools
+    ("get_cik_by_ticker", _company_tools, GET_CIK_BY_TICKER_DESCRIPTION),
+    ("get_company_info", _company_tools, GET_COMPANY_INFO_DESCRIPTION),
+    ("search_companies", _company_tools, SEARCH_COMPANIES_DESCRIPTION),
+    ("get_company_facts", _company_tools, GET_COMPANY_FACTS_DESCRIPTION),
+    # Filing Tools
+    ("get_recent_filings", _filings_tools, GET_RECENT_FILINGS_DESCRIPTION),
+    ("get_filing_content", _filings_tools, GET_FILING_CONTENT_DESCRIPTION),
+    ("analyze_8k", _filings_tools, ANALYZE_8K_DESCRIPTION),
+    ("get_filing_sections", _filings_tools, GET_FILING_SECTIONS_DESCRIPTION),
+    # Financial Tools
+    ("get_financials", _financial_tools, GET_FINANCIALS_DESCRIPTION),
+    ("get_segment_data", _financial_tools, GET_SEGMENT_DATA_DESCRIPTION),
+    ("get_key_metrics", _financial_tools, GET_KEY_METRICS_DESCRIPTION),
+    ("compare_periods", _financial_tools, COMPARE_PERIODS_DESCRIPTION),
+    ("discover_company_metrics", _financial_tools, DISCOVER_COMPANY_METRICS_DESCRIPTION),
+    ("get_xbrl_concepts", _financial_tools, GET_XBRL_CONCEPTS_DESCRIPTION),
+    ("discover_xbrl_concepts", _financial_tools, DISCOVER_XBRL_CONCEPTS_DESCRIPTION),
     # Insider Trading Tools
-    mcp.add_tool(get_insider_transactions)
-    mcp.add_tool(get_insider_summary)
-    mcp.add_tool(get_form4_details)
-    mcp.add_tool(analyze_form4_transactions)
-    mcp.add_tool(analyze_insider_sentiment)
+    ("get_insider_transactions", _insider_tools, GET_INSIDER_TRANSACTIONS_DESCRIPTION),
+    ("get_insider_summary", _insider_tools, GET_INSIDER_SUMMARY_DESCRIPTION),
+    ("get_form4_details", _insider_tools, GET_FORM4_DETAILS_DESCRIPTION),
+    ("analyze_form4_transactions", _insider_tools, ANALYZE_FORM4_TRANSACTIONS_DESCRIPTION),
+    ("analyze_insider_sentiment", _insider_tools, ANALYZE_INSIDER_SENTIMENT_DESCRIPTION),
+)
+
+
+# Tools whose result is fully determined by the filing's accession number
+_ACCESSION_TOOLS = frozenset(
+    {
+        "get_filing_content",
+        "analyze_8k",
+        "get_filing_sections",
+        "get_xbrl_concepts",
+        "discover_xbrl_concepts",
+        "get_form4_details",
+    }
+)
+
+
+def register_tools(mcp):
+    """Register all tools with the MCP server."""
+    filing_cache = FilingCache()
+    for name, tool_group, description in TOOL_MAP:
+        tool = getattr(tool_group(), name)
+        if name in _ACCESSION_TOOLS:
+            tool = filing_cache.memoize(tool)
+        # Bound methods are annotated -> ToolResponse; without this FastMCP would
+        # also return every result as structuredContent alongside the JSON text.
+        mcp.add_tool(tool, description=description, structured_output=False)
 
     # Utility Tools
     mcp.add_tool(get_recommended_tools)
 
 
+def _use_fast_event_loop():
+    """Install uvloop as the asyncio event loop for HTTP transports, if it is installed."""
+    # uvloop is an optional dependency (the "http" extra) and is not available on Windows
+    try:
+        import uvloop
+    except ImportError:
+        return
+
+    import asyncio
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def _main_stdio():
+    """Run the MCP server over stdio, the default when launched without arguments."""
+    mcp = SecEdgarMCP("SEC EDGAR MCP", dependencies=["edgartools"])
+    register_tools(mcp)
+    mcp.run(transport="stdio")
+
+
 def main():
     """Main entry point for the MCP server."""
+    # MCP clients spawn one stdio process per session, usually with no
+    # arguments; skip building the argument parser in that case.
+    if len(sys.argv) <= 1:
+        _main_stdio()
+        return
+
+    import argparse
 
     parser = argparse.ArgumentParser(description="SEC EDGAR MCP Server - Access SEC filings and financial data")
     parser.add_argument("--transport", default="stdio", help="Transport method")
@@ -525,11 +555,15 @@ def main():
     parser.add_argument("--port", type=int, default=9870, help="Port to bind to (default: 9870)")
     args = parser.parse_args()
 
+    # HTTP transports serve many concurrent sessions from one event loop
+    if args.transport != "stdio":
+        _use_fast_event_loop()
+
     # Initialize MCP server with appropriate configuration
     if args.transport == "streamable-http":
-        mcp = FastMCP("SEC EDGAR MCP", host=args.host, port=args.port, dependencies=["edgartools"])
+        mcp = SecEdgarMCP("SEC EDGAR MCP", host=args.host, port=args.port, dependencies=["edgartools"])
     else:
-        mcp = FastMCP("SEC EDGAR MCP", dependencies=["edgartools"])
+        mcp = SecEdgarMCP("SEC EDGAR MCP", dependencies=["edgartools"])
 
     # Register all tools after initialization
     register_tools(mcp)
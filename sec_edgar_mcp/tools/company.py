@@ -1,3 +1,4 @@
+from typing import Optional
 from ..core.client import EdgarClient
 from ..core.models import CompanyInfo
 from ..utils.exceptions import CompanyNotFoundError
@@ -7,8 +8,10 @@ from .types import ToolResponse
 class CompanyTools:
     """Tools for company-related operations."""
 
-    def __init__(self):
-        self.client = EdgarClient()
+    __slots__ = ("client",)
+
+    def __init__(self, client: Optional[EdgarClient] = None):
+        self.client = client or EdgarClient()
 
     def get_cik_by_ticker(self, ticker: str) -> ToolResponse:
         """Get the CIK for a company based on its ticker symbol."""
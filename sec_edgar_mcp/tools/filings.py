@@ -10,8 +10,10 @@ from .types import ToolResponse
 class FilingsTools:
     """Tools for filing-related operations."""
 
-    def __init__(self):
-        self.client = EdgarClient()
+    __slots__ = ("client",)
+
+    def __init__(self, client: Optional[EdgarClient] = None):
+        self.client = client or EdgarClient()
 
     def get_recent_filings(
         self,
@@ -85,6 +87,7 @@ class FilingsTools:
 
             # For structured filings, get the data object
             filing_data = {}
+            partial = False
             try:
                 obj = filing.obj()
                 if obj:
@@ -97,9 +100,9 @@ class FilingsTools:
                     elif filing.form in ["3", "4", "5"]:
                         filing_data["is_ownership"] = True
             except Exception:
-                pass
+                partial = True
 
-            return {
+            result = {
                 "success": True,
                 "accession_number": filing.accession_number,
                 "form_type": filing.form,
@@ -109,6 +112,9 @@ class FilingsTools:
                 "filing_data": filing_data,
                 "url": filing.url,
             }
+            if partial:
+                result["partial"] = True
+            return result
         except FilingNotFoundError as e:
             return {"success": False, "error": str(e)}
         except Exception as e:
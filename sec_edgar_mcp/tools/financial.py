@@ -1,15 +1,131 @@
-from typing import List, Optional
-import requests
+import re
+import sys
+from typing import Any, Dict, List, Optional, Tuple
 from ..core.client import EdgarClient
 from ..config import initialize_config
+from ..utils.http import SHARED_SESSION
 from .types import ToolResponse
 
 
+def _compute_growth(period_data: List[dict]) -> Tuple[float, float]:
+    """Total growth and CAGR (both in percent) between the first and last of the year-sorted periods."""
+    if len(period_data) < 2:
+        return 0, 0
+
+    first_value = period_data[0]["value"]
+    last_value = period_data[-1]["value"]
+    if first_value == 0:
+        return 0, 0
+
+    total_growth = ((last_value - first_value) / first_value) * 100
+    years = period_data[-1]["year"] - period_data[0]["year"]
+    if years > 0:
+        cagr = (((last_value / first_value) ** (1 / years)) - 1) * 100
+    else:
+        cagr = 0
+    return total_growth, cagr
+
+
+class InlineXBRLFacts:
+    """Inline XBRL facts of a raw filing, indexed in a single pass over the document.
+
+    Looking up a concept scans this small fact list instead of running several
+    regular expressions over the whole (often tens of MB) filing text. Only the
+    facts and context periods are kept, not the filing text itself.
+    """
+
+    _FACT_PATTERN = re.compile(r"<ix:(nonFraction|nonNumeric)\b[^>]*>([^<]+)</ix:\1>", re.IGNORECASE | re.DOTALL)
+    _NAME_PATTERN = re.compile(r'name="([^"]*)"', re.IGNORECASE)
+    _SCALE_PATTERN = re.compile(r'scale="(-?\d+)"')
+    _CONTEXT_REF_PATTERN = re.compile(r'contextRef="([^"]+)"')
+    _CONTEXT_PATTERN = re.compile(r'<xbrli:context[^>]*id="([^"]+)"[^>]*>(.*?)</xbrli:context>', re.DOTALL)
+    _PLACEHOLDERS = frozenset(["--", "—", "--06-30"])
+
+    def __init__(self, filing_content: str):
+        # (lower-cased concept name, contextRef, scale, value text) per fact kind, in document order.
+        # Names and contexts repeat across many facts, so they are interned to share one string each.
+        self._facts: Dict[str, List[tuple]] = {"nonfraction": [], "nonnumeric": []}
+        for match in self._FACT_PATTERN.finditer(filing_content):
+            tag = match.group(0)
+            name_match = self._NAME_PATTERN.search(tag)
+            if name_match:
+                scale_match = self._SCALE_PATTERN.search(tag)
+                context_ref_match = self._CONTEXT_REF_PATTERN.search(tag)
+                self._facts[match.group(1).lower()].append(
+                    (
+                        sys.intern(name_match.group(1).lower()),
+                        sys.intern(context_ref_match.group(1)) if context_ref_match else None,
+                        int(scale_match.group(1)) if scale_match else 0,
+                        match.group(2).strip(),
+                    )
+                )
+
+        # End date (or instant) of each context
+        self._periods: Dict[str, Optional[str]] = {}
+        for match in self._CONTEXT_PATTERN.finditer(filing_content):
+            date_match = re.search(r"<xbrli:endDate>([^<]+)</xbrli:endDate>", match.group(2))
+            if not date_match:
+                date_match = re.search(r"<xbrli:instant>([^<]+)</xbrli:instant>", match.group(2))
+            period = sys.intern(date_match.group(1)) if date_match else None
+            self._periods.setdefault(sys.intern(match.group(1)), period)
+
+    def find(self, concept: str) -> Optional[dict]:
+        """Return the first usable fact for a concept, preferring exact name matches over substring matches."""
+        concept_lower = concept.lower()
+        suffix = ":" + concept_lower
+        matchers = (
+            lambda name: name.endswith(suffix),
+            lambda name: name == concept_lower,
+            lambda name: concept_lower in name,
+        )
+        for kind in ("nonfraction", "nonnumeric"):
+            for matches in matchers:
+                for name, context_ref, scale, value_text in self._facts[kind]:
+                    # Skip empty or placeholder values
+                    if not matches(name) or not value_text or value_text in self._PLACEHOLDERS:
+                        continue
+                    return self._to_value(context_ref, scale, value_text)
+        return None
+
+    def _to_value(self, context_ref: Optional[str], scale: int, value_text: str) -> dict:
+        try:
+            # Remove commas and convert to number
+            numeric_text = re.sub(r"[,$()]", "", value_text)
+
+            # Handle negative values in parentheses
+            if "(" in value_text and ")" in value_text:
+                numeric_text = "-" + numeric_text
+
+            numeric_value = float(numeric_text)
+        except (ValueError, TypeError):
+            # If not numeric, return as text
+            return {
+                "value": value_text,
+                "raw_value": value_text,
+                "period": None,
+                "context_ref": None,
+                "source": "xbrl_text_extraction",
+            }
+
+        return {
+            "value": numeric_value * (10**scale),
+            "raw_value": value_text,
+            "period": self._periods.get(context_ref) if context_ref else None,
+            "context_ref": context_ref,
+            "scale": scale,
+            "source": "xbrl_direct_extraction",
+        }
+
+
 class FinancialTools:
     """Tools for financial data and XBRL operations."""
 
-    def __init__(self):
-        self.client = EdgarClient()
+    __slots__ = ("client", "_inline_facts")
+
+    def __init__(self, client: Optional[EdgarClient] = None):
+        self.client = client or EdgarClient()
+        # (accession number, facts) for the most recently fetched filing
+        self._inline_facts: Optional[tuple] = None
 
     def get_financials(self, identifier: str, statement_type: str = "all") -> ToolResponse:
         """Get financial statements for a company by parsing XBRL data from filings."""
@@ -101,12 +217,16 @@ class FinancialTools:
                 },
             }
 
-            # Get XBRL data from the filing for direct access
-            xbrl = None
-            try:
-                xbrl = latest_filing.xbrl()
-            except Exception:
-                pass
+            # Raw XBRL is only parsed if a statement has to fall back to it
+            xbrl_cache: List[Any] = []
+
+            def get_xbrl():
+                if not xbrl_cache:
+                    try:
+                        xbrl_cache.append(latest_filing.xbrl())
+                    except Exception:
+                        xbrl_cache.append(None)
+                return xbrl_cache[0]
 
             # Extract financial statements - these are parsed from XBRL
             if statement_type in ["income", "all"]:
@@ -119,25 +239,9 @@ class FinancialTools:
                             "index": list(income.index),
                         }
                     else:
-                        # Try to get income statement from XBRL directly
-                        if xbrl and hasattr(xbrl, "get_statement_by_type"):
-                            try:
-                                income_stmt = xbrl.get_statement_by_type("IncomeStatement")
-                                if income_stmt:
-                                    result["statements"]["income_statement"] = {
-                                        "xbrl_statement": str(income_stmt)[:5000]
-                                    }
-                            except Exception:
-                                pass
-
-                        # Dynamically discover income statement concepts
-                        if xbrl:
-                            income_concepts = self._discover_statement_concepts(xbrl, latest_filing, "income")
-                            if income_concepts:
-                                result["statements"]["income_statement"] = {
-                                    "data": income_concepts,
-                                    "source": "xbrl_concepts_dynamic",
-                                }
+                        statement = self._statement_from_xbrl(get_xbrl(), latest_filing, "IncomeStatement", "income")
+                        if statement:
+                            result["statements"]["income_statement"] = statement
                 except Exception as e:
                     result["statements"]["income_statement_error"] = str(e)
 
@@ -151,23 +255,9 @@ class FinancialTools:
                             "index": list(balance.index),
                         }
                     else:
-                        # Try to get balance sheet from XBRL directly
-                        if xbrl and hasattr(xbrl, "get_statement_by_type"):
-                            try:
-                                balance_stmt = xbrl.get_statement_by_type("BalanceSheet")
-                                if balance_stmt:
-                                    result["statements"]["balance_sheet"] = {"xbrl_statement": str(balance_stmt)[:5000]}
-                            except Exception:
-                                pass
-
-                        # Dynamically discover balance sheet concepts
-                        if xbrl:
-                            balance_concepts = self._discover_statement_concepts(xbrl, latest_filing, "balance")
-                            if balance_concepts:
-                                result["statements"]["balance_sheet"] = {
-                                    "data": balance_concepts,
-                                    "source": "xbrl_concepts_dynamic",
-                                }
+                        statement = self._statement_from_xbrl(get_xbrl(), latest_filing, "BalanceSheet", "balance")
+                        if statement:
+                            result["statements"]["balance_sheet"] = statement
                 except Exception as e:
                     result["statements"]["balance_sheet_error"] = str(e)
 
@@ -181,24 +271,9 @@ class FinancialTools:
                             "index": list(cash.index),
                         }
                     else:
-                        # Try to get cash flow from XBRL directly
-                        if xbrl and hasattr(xbrl, "get_statement_by_type"):
-                            try:
-                                cash_stmt = xbrl.get_statement_by_type("CashFlow")
-                                if cash_stmt:
-                                    result["statements"]["cash_flow"] = {"xbrl_statement": str(cash_stmt)[:5000]}
-                            except Exception:
-                                pass
-
-                        # Dynamically discover cash flow related concepts
-                        if xbrl:
-                            cash_concepts = self._discover_statement_concepts(xbrl, latest_filing, "cash")
-
-                            if cash_concepts:
-                                result["statements"]["cash_flow"] = {
-                                    "data": cash_concepts,
-                                    "source": "xbrl_concepts_dynamic",
-                                }
+                        statement = self._statement_from_xbrl(get_xbrl(), latest_filing, "CashFlow", "cash")
+                        if statement:
+                            result["statements"]["cash_flow"] = statement
                 except Exception as e:
                     result["statements"]["cash_flow_error"] = str(e)
 
@@ -212,6 +287,25 @@ class FinancialTools:
         except Exception as e:
             return {"success": False, "error": f"Failed to get financials: {str(e)}"}
 
+    def _statement_from_xbrl(self, xbrl, filing, xbrl_statement_type, concept_type):
+        """Fallback statement data from raw XBRL: discovered concepts, else the rendered statement."""
+        if not xbrl:
+            return None
+
+        # Discovered concepts take precedence, so the statement is only rendered when none are found
+        concepts = self._discover_statement_concepts(xbrl, filing, concept_type)
+        if concepts:
+            return {"data": concepts, "source": "xbrl_concepts_dynamic"}
+
+        if hasattr(xbrl, "get_statement_by_type"):
+            try:
+                statement = xbrl.get_statement_by_type(xbrl_statement_type)
+                if statement:
+                    return {"xbrl_statement": str(statement)[:5000]}
+            except Exception:
+                pass
+        return None
+
     def _extract_income_statement(self, xbrl_data):
         """Extract income statement items from XBRL data."""
         income_concepts = [
@@ -393,19 +487,17 @@ class FinancialTools:
                                 # Get the most recent value
                                 for unit_type, unit_data in metric_data["units"].items():
                                     if unit_data:
-                                        # Sort by end date and get the latest
-                                        sorted_data = sorted(unit_data, key=lambda x: x.get("end", ""), reverse=True)
-                                        if sorted_data:
-                                            latest = sorted_data[0]
-                                            result_metrics[metric] = {
-                                                "value": float(latest.get("val", 0)),
-                                                "unit": unit_type,
-                                                "period": latest.get("end", ""),
-                                                "form": latest.get("form", ""),
-                                                "fiscal_year": latest.get("fy", ""),
-                                                "fiscal_period": latest.get("fp", ""),
-                                            }
-                                            break
+                                        # Latest by end date; a single pass instead of sorting every fact
+                                        latest = max(unit_data, key=lambda x: x.get("end", ""))
+                                        result_metrics[metric] = {
+                                            "value": float(latest.get("val", 0)),
+                                            "unit": unit_type,
+                                            "period": latest.get("end", ""),
+                                            "form": latest.get("form", ""),
+                                            "fiscal_year": latest.get("fy", ""),
+                                            "fiscal_period": latest.get("fp", ""),
+                                        }
+                                        break
 
             return {
                 "success": True,
@@ -429,9 +521,11 @@ class FinancialTools:
             if fact_data is None or fact_data.empty:
                 return {"success": False, "error": f"No data found for metric: {metric}"}
 
-            # Filter by year range
+            # Filter by year range. All years come from the single company facts
+            # response; iterate plain dict records rather than iterrows(), which
+            # builds a pandas Series per row.
             period_data = []
-            for _, row in fact_data.iterrows():
+            for row in fact_data.to_dict("records"):
                 try:
                     year = int(row.get("fy", 0))
                     if start_year <= year <= end_year:
@@ -451,23 +545,7 @@ class FinancialTools:
             period_data.sort(key=lambda x: x["year"])
 
             # Calculate growth rates
-            if len(period_data) >= 2:
-                first_value = period_data[0]["value"]
-                last_value = period_data[-1]["value"]
-
-                if first_value != 0:
-                    total_growth = ((last_value - first_value) / first_value) * 100
-                    years = period_data[-1]["year"] - period_data[0]["year"]
-                    if years > 0:
-                        cagr = (((last_value / first_value) ** (1 / years)) - 1) * 100
-                    else:
-                        cagr = 0
-                else:
-                    total_growth = 0
-                    cagr = 0
-            else:
-                total_growth = 0
-                cagr = 0
+            total_growth, cagr = _compute_growth(period_data)
 
             return {
                 "success": True,
@@ -621,6 +699,11 @@ class FinancialTools:
                 result["concepts"] = all_concepts
                 result["total_concepts"] = len(all_concepts)
 
+            # Values without a source came from the edgartools fallback, e.g. because the raw
+            # filing could not be fetched; mark the result so it is not cached as final
+            if not result["concepts"] or any("source" not in value for value in result["concepts"].values()):
+                result["partial"] = True
+
             return result
 
         except Exception as e:
@@ -630,14 +713,13 @@ class FinancialTools:
         """Get a specific concept from XBRL data using direct filing content extraction."""
         try:
             # Get raw filing content for direct parsing
-            user_agent = initialize_config()
-            filing_content = self._fetch_filing_content(filing.cik, filing.accession_number, user_agent)
+            facts = self._get_inline_facts(filing)
 
-            if not filing_content:
+            if facts is None:
                 return self._get_xbrl_concept_fallback(xbrl, concept_name)
 
-            # Extract the concept using direct regex parsing
-            extracted_value = self._extract_xbrl_concept_value(filing_content, concept_name)
+            # Extract the concept from the indexed inline XBRL facts
+            extracted_value = facts.find(concept_name)
 
             if extracted_value:
                 return {
@@ -712,10 +794,9 @@ class FinancialTools:
 
         try:
             # Get the raw filing content
-            user_agent = initialize_config()
-            filing_content = self._fetch_filing_content(filing.cik, filing.accession_number, user_agent)
+            facts = self._get_inline_facts(filing)
 
-            if not filing_content:
+            if facts is None:
                 return discovered_concepts
 
             # Define concept patterns for different statement types
@@ -753,7 +834,7 @@ class FinancialTools:
             concepts_to_find = concept_patterns.get(statement_type, [])
 
             for concept in concepts_to_find:
-                extracted_value = self._extract_xbrl_concept_value(filing_content, concept)
+                extracted_value = facts.find(concept)
                 if extracted_value:
                     discovered_concepts[concept] = extracted_value
 
@@ -777,104 +858,27 @@ class FinancialTools:
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             }
 
-            response = requests.get(url, headers=headers, timeout=30)
+            response = SHARED_SESSION.get(url, headers=headers, timeout=30)
             response.raise_for_status()
             return response.text
 
         except Exception:
             return None
 
-    def _extract_xbrl_concept_value(self, filing_content, concept):
-        """Extract XBRL concept value using regex patterns like the old server."""
-        import re
-
-        try:
-            # Pattern to find XBRL facts - flexible search for any tag containing the concept name
-            patterns = [
-                # Exact matches first (highest priority)
-                rf'<ix:nonFraction[^>]*name="[^"]*:{re.escape(concept)}"[^>]*>([^<]+)</ix:nonFraction>',
-                rf'<ix:nonFraction[^>]*name="{re.escape(concept)}"[^>]*>([^<]+)</ix:nonFraction>',
-                # Flexible substring matches - any tag name containing the concept
-                rf'<ix:nonFraction[^>]*name="[^"]*{re.escape(concept)}[^"]*"[^>]*>([^<]+)</ix:nonFraction>',
-                # Same for nonNumeric tags
-                rf'<ix:nonNumeric[^>]*name="[^"]*:{re.escape(concept)}"[^>]*>([^<]+)</ix:nonNumeric>',
-                rf'<ix:nonNumeric[^>]*name="{re.escape(concept)}"[^>]*>([^<]+)</ix:nonNumeric>',
-                rf'<ix:nonNumeric[^>]*name="[^"]*{re.escape(concept)}[^"]*"[^>]*>([^<]+)</ix:nonNumeric>',
-            ]
-
-            for pattern in patterns:
-                matches = re.finditer(pattern, filing_content, re.IGNORECASE | re.DOTALL)
-
-                for match in matches:
-                    value_text = match.group(1).strip()
-
-                    # Skip empty or placeholder values
-                    if not value_text or value_text in ["--", "—", "--06-30"]:
-                        continue
-
-                    # Try to extract numeric value
-                    try:
-                        # Remove commas and convert to number
-                        numeric_text = re.sub(r"[,$()]", "", value_text)
-
-                        # Handle negative values in parentheses
-                        if "(" in value_text and ")" in value_text:
-                            numeric_text = "-" + numeric_text
-
-                        numeric_value = float(numeric_text)
-
-                        # Extract scale attribute if present
-                        scale_match = re.search(r'scale="(-?\d+)"', match.group(0))
-                        scale = int(scale_match.group(1)) if scale_match else 0
-
-                        # Apply scale
-                        actual_value = numeric_value * (10**scale)
-
-                        # Extract context and period info
-                        context_ref_match = re.search(r'contextRef="([^"]+)"', match.group(0))
-                        context_ref = context_ref_match.group(1) if context_ref_match else None
-
-                        # Find the context to get period info
-                        period = None
-                        if context_ref:
-                            context_pattern = (
-                                rf'<xbrli:context[^>]*id="{re.escape(context_ref)}"[^>]*>(.*?)</xbrli:context>'
-                            )
-                            context_match = re.search(context_pattern, filing_content, re.DOTALL)
-                            if context_match:
-                                # Extract end date
-                                date_match = re.search(
-                                    r"<xbrli:endDate>([^<]+)</xbrli:endDate>", context_match.group(1)
-                                )
-                                if not date_match:
-                                    date_match = re.search(
-                                        r"<xbrli:instant>([^<]+)</xbrli:instant>", context_match.group(1)
-                                    )
-                                period = date_match.group(1) if date_match else None
-
-                        return {
-                            "value": actual_value,
-                            "raw_value": value_text,
-                            "period": period,
-                            "context_ref": context_ref,
-                            "scale": scale,
-                            "source": "xbrl_direct_extraction",
-                        }
-
-                    except (ValueError, TypeError):
-                        # If not numeric, return as text
-                        return {
-                            "value": value_text,
-                            "raw_value": value_text,
-                            "period": None,
-                            "context_ref": None,
-                            "source": "xbrl_text_extraction",
-                        }
+    def _get_inline_facts(self, filing) -> Optional[InlineXBRLFacts]:
+        """Fetch and index a filing's inline XBRL facts, reusing the last filing's index."""
+        cached = self._inline_facts
+        if cached is not None and cached[0] == filing.accession_number:
+            return cached[1]
 
+        user_agent = initialize_config()
+        filing_content = self._fetch_filing_content(filing.cik, filing.accession_number, user_agent)
+        if not filing_content:
             return None
 
-        except Exception:
-            return None
+        facts = InlineXBRLFacts(filing_content)
+        self._inline_facts = (filing.accession_number, facts)
+        return facts
 
     def _get_all_financial_concepts(self, xbrl, filing):
         """Extract all major financial concepts from XBRL."""
@@ -1018,7 +1022,7 @@ class FinancialTools:
                 except Exception:
                     pass
 
-            return {
+            result = {
                 "success": True,
                 "cik": company.cik,
                 "name": company.name,
@@ -1032,6 +1036,9 @@ class FinancialTools:
                 "total_facts": len(all_facts),
                 "sample_facts": dict(list(all_facts.items())[:20]),
             }
+            if "error" in all_facts:
+                result["partial"] = True
+            return result
 
         except Exception as e:
             return {"success": False, "error": f"Failed to discover XBRL concepts: {str(e)}"}
@@ -8,8 +8,10 @@ from .types import ToolResponse
 class InsiderTools:
     """Tools for insider trading data (Forms 3, 4, 5) - simplified version."""
 
-    def __init__(self):
-        self.client = EdgarClient()
+    __slots__ = ("client",)
+
+    def __init__(self, client: Optional[EdgarClient] = None):
+        self.client = client or EdgarClient()
 
     def get_insider_transactions(
         self, identifier: str, form_types: Optional[List[str]] = None, days: int = 90, limit: int = 50
@@ -204,7 +206,7 @@ class InsiderTools:
                         "is_ten_percent_owner": getattr(form4, "is_ten_percent_owner", False),
                     }
             except Exception:
-                pass
+                return {"success": True, "form4_details": details, "partial": True}
 
             return {"success": True, "form4_details": details}
         except Exception as e:
@@ -1,9 +1,10 @@
-from .cache import TickerCache
+from .cache import FilingCache, TickerCache
 from .constants import SEC_USER_AGENT
 from .exceptions import SECEdgarMCPError, CompanyNotFoundError, FilingNotFoundError
 
 __all__ = [
     "TickerCache",
+    "FilingCache",
     "SEC_USER_AGENT",
     "SECEdgarMCPError",
     "CompanyNotFoundError",
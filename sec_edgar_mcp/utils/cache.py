@@ -1,7 +1,13 @@
-import requests
+import functools
+import hashlib
+import inspect
+import json
 import os
-from typing import Dict, Optional
+import time
+from typing import Any, Callable, Dict, Optional
+import pydantic_core
 from .exceptions import APIError
+from .http import SHARED_SESSION
 
 
 class TickerCache:
@@ -24,7 +30,7 @@ class TickerCache:
         try:
             url = "https://www.sec.gov/files/company_tickers_exchange.json"
             headers = {"User-Agent": self._user_agent}
-            response = requests.get(url, headers=headers)
+            response = SHARED_SESSION.get(url, headers=headers)
             response.raise_for_status()
 
             data = response.json()
@@ -54,3 +60,114 @@ class TickerCache:
     def clear(self) -> None:
         """Clear the cache."""
         self._cache = None
+
+
+class FilingCache:
+    """On-disk cache for tool results about a single, immutable SEC filing.
+
+    Filings never change once an accession number is assigned, so results for
+    calls that name an accession number are persisted and reused across
+    processes. Setting SEC_EDGAR_CACHE_DIR to an empty string disables the cache.
+    """
+
+    def __init__(self, directory: Optional[str] = None, ttl: int = 7 * 24 * 60 * 60, max_entries: Optional[int] = None):
+        if directory is None:
+            directory = os.getenv("SEC_EDGAR_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "sec-edgar"))
+        self._directory = directory or None
+        self._ttl = ttl
+        if max_entries is None:
+            try:
+                max_entries = int(os.getenv("SEC_EDGAR_MAX_CACHE_SIZE", "100"))
+            except ValueError:
+                max_entries = 100
+        self._max_entries = max_entries
+
+    @property
+    def enabled(self) -> bool:
+        return self._directory is not None and self._max_entries > 0
+
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        """Return the cached result for key, or None if missing or expired."""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            if time.time() - os.path.getmtime(path) > self._ttl:
+                return None
+            with open(path, "rb") as f:
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: Any, value: Dict[str, Any]) -> None:
+        """Store a result; failures to write are ignored."""
+        if not self.enabled:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            # Encode the way FastMCP does, so a cached result is sent unchanged
+            data = pydantic_core.to_json(value, fallback=str)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except (OSError, ValueError, pydantic_core.PydanticSerializationError):
+            return
+        self._prune()
+
+    def _prune(self) -> None:
+        """Delete expired entries, then the oldest ones beyond the size limit."""
+        try:
+            names = [name for name in os.listdir(self._directory) if name.endswith(".json")]
+        except OSError:
+            return
+
+        now = time.time()
+        entries = []
+        for name in names:
+            path = os.path.join(self._directory, name)
+            try:
+                mtime = os.path.getmtime(path)
+                if now - mtime > self._ttl:
+                    os.remove(path)
+                else:
+                    entries.append((mtime, path))
+            except OSError:
+                pass
+
+        entries.sort()
+        for _, path in entries[: max(len(entries) - self._max_entries, 0)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def memoize(self, func: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+        """Wrap a tool so complete, successful calls that name an accession number are cached."""
+        if not self.enabled:
+            return func
+
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            if not bound.arguments.get("accession_number"):
+                return func(*args, **kwargs)
+
+            key = (func.__name__, bound.arguments)
+            result = self.get(key)
+            if result is None:
+                result = func(*args, **kwargs)
+                # Results marked partial depended on a failed lookup and may differ on retry
+                if isinstance(result, dict) and result.get("success") and not result.get("partial"):
+                    self.set(key, result)
+            return result
+
+        return wrapper
+
+    def _path(self, key: Any) -> str:
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode()).hexdigest()
+        return os.path.join(self._directory, f"{digest}.json")
@@ -1,23 +1,36 @@
+import sys
+from types import MappingProxyType
+
 SEC_USER_AGENT = "SEC EDGAR MCP/1.0"
 
-FILING_TYPES = {
-    "10-K": "Annual report",
-    "10-Q": "Quarterly report",
-    "8-K": "Current report",
-    "DEF 14A": "Proxy statement",
-    "S-1": "Registration statement",
-    "3": "Initial ownership report",
-    "4": "Change in ownership report",
-    "5": "Annual ownership report",
-    "13F-HR": "Quarterly institutional holdings",
-    "SC 13G": "Beneficial ownership report",
-    "SC 13D": "Beneficial ownership report with intent",
-    "CORRESP": "Correspondence",
-    "UPLOAD": "Upload",
-}
+FILING_TYPES = MappingProxyType(
+    {
+        sys.intern(form_type): description
+        for form_type, description in {
+            "10-K": "Annual report",
+            "10-Q": "Quarterly report",
+            "8-K": "Current report",
+            "DEF 14A": "Proxy statement",
+            "S-1": "Registration statement",
+            "3": "Initial ownership report",
+            "4": "Change in ownership report",
+            "5": "Annual ownership report",
+            "13F-HR": "Quarterly institutional holdings",
+            "SC 13G": "Beneficial ownership report",
+            "SC 13D": "Beneficial ownership report with intent",
+            "CORRESP": "Correspondence",
+            "UPLOAD": "Upload",
+        }.items()
+    }
+)
 
-XBRL_NAMESPACES = {
-    "dei": "http://xbrl.sec.gov/dei",
-    "us-gaap": "http://fasb.org/us-gaap",
-    "ifrs": "http://xbrl.ifrs.org/taxonomy",
-}
+XBRL_NAMESPACES = MappingProxyType(
+    {
+        sys.intern(prefix): uri
+        for prefix, uri in {
+            "dei": "http://xbrl.sec.gov/dei",
+            "us-gaap": "http://fasb.org/us-gaap",
+            "ifrs": "http://xbrl.ifrs.org/taxonomy",
+        }.items()
+    }
+)
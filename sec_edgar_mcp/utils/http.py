@@ -0,0 +1,7 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+# One connection pool for every direct request to SEC EDGAR, so repeated
+# calls reuse TLS connections instead of opening a new one each time.
+SHARED_SESSION = requests.Session()
+SHARED_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50))